@@ -175,10 +175,20 @@ class ClientTest(unittest.IsolatedAsyncioTestCase):
         await self.client.get_tab_map(fname)
         await self.client.get_member_list(fname)
         await self.client.get_forum_detail(fname)
+        detail, bawu_dict, tab_map = await self.client.get_forum_bundle(fname)
+        self.assertEqual(detail[0], fname)
+        self.assertIsInstance(bawu_dict, dict)
+        self.assertIsInstance(tab_map, dict)
 
         await self.client.get_self_threads()
         await self.client.get_self_posts()
         await self.client.get_self_forum_list()
+        forums = await self.client.get_forum_list(user_id)
+        fnames, fids, levels, exps = await self.client.get_forum_list_columns(user_id)
+        self.assertEqual(fnames, [forum[0] for forum in forums])
+        self.assertEqual(fids.tolist(), [forum[1] for forum in forums])
+        self.assertEqual(levels.tolist(), [forum[2] for forum in forums])
+        self.assertEqual(exps.tolist(), [forum[3] for forum in forums])
 
         replys = await self.client.get_replys()
         self.assertGreater(len(replys), 0)
@@ -950,6 +950,14 @@ if __name__ == '__main__':
         async with Listener() as listener:
             await listener.run()
 
+    # 可选依赖 安装uvloop后替换默认事件循环
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
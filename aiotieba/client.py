@@ -4,27 +4,37 @@ __all__ = ['Client']
 import asyncio
 import base64
 import binascii
+import functools
 import gzip
 import hashlib
-import json
+import os
 import random
 import re
 import socket
+import tempfile
 import time
+import urllib.parse
 import uuid
 import weakref
-from typing import ClassVar, Dict, List, Literal, Optional, Tuple, Union
+from typing import ClassVar, Dict, List, Literal, Optional, Tuple, TypeVar, Union
 
 import aiohttp
 import cv2 as cv
 import numpy as np
+import orjson
 import yarl
-from bs4 import BeautifulSoup
 from Crypto.Cipher import AES, PKCS1_v1_5
 from Crypto.PublicKey import RSA
 from google.protobuf.json_format import ParseDict
+from google.protobuf.message import Message
+from lxml import etree
 
-from .config import CONFIG
+try:
+    from isal.igzip import decompress as _gzip_decompress
+except ImportError:
+    _gzip_decompress = gzip.decompress
+
+from .config import CONFIG, SCRIPT_DIR
 from .logger import LOG
 from .tieba_protobuf import (
     CommitPersonalMsgReqIdl_pb2,
@@ -32,7 +42,6 @@ from .tieba_protobuf import (
     CommonReq_pb2,
     FrsPageReqIdl_pb2,
     FrsPageResIdl_pb2,
-    GetBawuInfoReqIdl_pb2,
     GetBawuInfoResIdl_pb2,
     GetDislikeListReqIdl_pb2,
     GetDislikeListResIdl_pb2,
@@ -49,7 +58,6 @@ from .tieba_protobuf import (
     PbPageResIdl_pb2,
     ReplyMeReqIdl_pb2,
     ReplyMeResIdl_pb2,
-    SearchPostForumReqIdl_pb2,
     SearchPostForumResIdl_pb2,
     ThreadInfo_pb2,
     UpdateClientInfoReqIdl_pb2,
@@ -73,6 +81,285 @@ from .types import (
     UserPosts,
 )
 
+_PROTO_BOUNDARY = "*-672328094-42-0"
+_PROTO_CONTENT_TYPE = f"multipart/form-data; boundary={_PROTO_BOUNDARY}"
+_PROTO_BODY_PREFIX = (
+    f"--{_PROTO_BOUNDARY}\r\nContent-Disposition: form-data; name=\"data\"; filename=\"file\"\r\n\r\n".encode('ascii')
+)
+_PROTO_BODY_SUFFIX = f"\r\n--{_PROTO_BOUNDARY}--\r\n".encode('ascii')
+
+# 以(need_gzip << 1) | need_encrypt为下标
+_WS_FLAG_LUT = (0x08, 0x48, 0x88, 0xC8)
+_AES_PAD_LUT = tuple(bytes([pad_num]) * pad_num for pad_num in range(1, 17))
+
+_SIGN_MD5 = hashlib.md5()
+_SIGN_SUFFIX = b"tiebaclient!!!"
+
+_FID_CACHE_PATH = SCRIPT_DIR / "cache/fid_dict.json"
+
+_READ_BUFFER_MAX_PREALLOC = 1 << 23
+
+# 仅需返回状态的接口可能抛出的异常 其余异常视为程序错误向上传递
+# 响应体格式异常由_check_status统一转为ValueError
+# aiohttp<3.10在连接被重置时会直接抛出不属于ClientError的ConnectionResetError 故一并捕获OSError
+_STATUS_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, OSError, ValueError)
+
+
+@functools.lru_cache(maxsize=64)
+def _pack_form_prefix(forms: Tuple[Tuple[str, str], ...]) -> Tuple[bytes, "hashlib._Hash"]:
+    """
+    编码form参数前缀 并计算签名的md5中间状态
+
+    Args:
+        forms (tuple[tuple[str, str], ...]): 在多次请求间保持不变的form参数前缀
+
+    Returns:
+        bytes: urlencode后的参数前缀
+        hashlib._Hash: 已输入参数前缀的md5 使用前需copy
+    """
+
+    md5 = _SIGN_MD5.copy()
+    md5.update("".join([f"{k}={v}" for k, v in forms]).encode('utf-8'))
+
+    return urllib.parse.urlencode(forms).encode('utf-8'), md5
+
+
+@functools.lru_cache(maxsize=256)
+def _pack_const_form(forms: Tuple[Tuple[str, str], ...]) -> bytes:
+    """
+    打包在多次请求间完全不变的form参数 返回带签名的完整请求体
+
+    Args:
+        forms (tuple[tuple[str, str], ...]): form参数元组
+
+    Returns:
+        bytes: urlencode后的请求体
+    """
+
+    md5 = _SIGN_MD5.copy()
+    md5.update("".join([f"{k}={v}" for k, v in forms]).encode('utf-8'))
+    md5.update(_SIGN_SUFFIX)
+
+    return urllib.parse.urlencode(forms + (('sign', md5.hexdigest()),)).encode('utf-8')
+
+
+def _encode_varint(value: int) -> bytes:
+    """
+    将非负整数编码为protobuf varint
+
+    Args:
+        value (int): 非负整数
+
+    Returns:
+        bytes: varint编码结果
+    """
+
+    buffer = bytearray()
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+    return bytes(buffer)
+
+
+def _pack_len_field(tag: bytes, value: bytes) -> bytes:
+    """
+    按length-delimited格式编码protobuf字段
+
+    Args:
+        tag (bytes): 字段的tag
+        value (bytes): 字段内容
+
+    Returns:
+        bytes: 编码结果
+    """
+
+    return b''.join([tag, _encode_varint(len(value)), value])
+
+
+@functools.lru_cache(maxsize=16)
+def _serialize_common_field(BDUSS: str, client_version: str) -> bytes:
+    """
+    序列化各DataReq中的common字段(field 1)
+
+    Args:
+        BDUSS (str): BDUSS
+        client_version (str): 客户端版本号
+
+    Returns:
+        bytes: 含tag的common字段序列化结果
+    """
+
+    common_proto = CommonReq_pb2.CommonReq()
+    common_proto.BDUSS = BDUSS
+    common_proto._client_version = client_version
+
+    return _pack_len_field(b'\x0a', common_proto.SerializeToString())
+
+
+_AID_EXP = re.compile(rb'aid=(\d+)')
+
+_M = TypeVar('_M', bound=Message)
+
+_STATISTICS_FIELDS = (
+    'view',
+    'thread',
+    'new_member',
+    'post',
+    'sign_ratio',
+    'average_time',
+    'average_times',
+    'recommend',
+)
+_NEWMSG_KEYS = ('fans', 'replyme', 'atme', 'agree', 'pletter', 'bookmark', 'count')
+
+_NEW_THREAD_FIELDS = (
+    ('forum_id', 'thread_id', 'post_id', 'create_time', 'user_id', 'reply_num', 'freq_num', 'share_num'),
+    ('forum_name', 'title'),
+    ('agree', 'poll_info', 'first_post_content'),
+)
+_THREAD_FIELDS = (
+    (
+        'id',
+        'fid',
+        'first_post_id',
+        'author_id',
+        'tab_id',
+        'is_good',
+        'is_top',
+        'is_share_thread',
+        'is_frs_mask',
+        'is_livepost',
+        'view_num',
+        'reply_num',
+        'share_num',
+        'create_time',
+        'last_time_int',
+    ),
+    ('fname', 'title'),
+    ('author', 'agree', 'poll_info', 'first_post_content', 'origin_thread_info'),
+)
+
+
+def _parse_dict_fields(
+    data_dict: dict, proto: _M, fields: Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]
+) -> _M:
+    """
+    将经JSON_DECODER解码的字典按字段表填入protobuf消息
+    整数与字符串字段直接赋值 仅对嵌套消息调用ParseDict
+
+    Args:
+        data_dict (dict): 空值已被转为None的字典
+        proto (_M): 待填充的protobuf消息
+        fields (tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]): 整数字段, 字符串字段, 消息字段
+
+    Returns:
+        _M: 填充后的protobuf消息
+    """
+
+    int_fields, str_fields, msg_fields = fields
+
+    for key in int_fields:
+        if (value := data_dict.get(key)) is not None:
+            setattr(proto, key, int(value))
+    for key in str_fields:
+        if (value := data_dict.get(key)) is not None:
+            setattr(proto, key, value)
+
+    for key in msg_fields:
+        if (value := data_dict.get(key)) is not None:
+            if isinstance(value, list):
+                repeated = getattr(proto, key)
+                for item in value:
+                    ParseDict(item, repeated.add(), ignore_unknown_fields=True)
+            else:
+                ParseDict(value, getattr(proto, key), ignore_unknown_fields=True)
+
+    return proto
+
+
+def _xpath_by_class(tag: str, class_name: str) -> etree.XPath:
+    """
+    编译按class匹配元素的XPath 与CSS类选择器的匹配规则一致
+
+    Args:
+        tag (str): 标签名
+        class_name (str): class名
+
+    Returns:
+        etree.XPath: 编译后的XPath
+    """
+
+    return etree.XPath(f"//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]")
+
+
+_XPATH_RECOVER_ITEM = _xpath_by_class('a', 'recover_list_item_btn')
+_XPATH_BLACK_ITEM = _xpath_by_class('td', 'left_cell')
+_XPATH_RANK_ITEM = etree.XPath("//tr[starts-with(@class, 'drl_list_item')]")
+_XPATH_MEMBER_ITEM = _xpath_by_class('div', 'name_wrap')
+
+_URL_FNAME2FID = yarl.URL.build(scheme="http", host="tieba.baidu.com", path="/f/commit/share/fnameShareApi")
+_URL_USER_PANEL = yarl.URL.build(scheme="https", host="tieba.baidu.com", path="/home/get/panel")
+_URL_USER_JSON = yarl.URL.build(scheme="http", host="tieba.baidu.com", path="/i/sys/user_json")
+_URL_CHAT_USER_INFO = yarl.URL.build(scheme="http", host="tieba.baidu.com", path="/im/pcmsg/query/getUserInfo")
+_URL_FURANK = yarl.URL.build(scheme="http", host="tieba.baidu.com", path="/f/like/furank")
+_URL_LIST_MEMBER_INFO = yarl.URL.build(scheme="http", host="tieba.baidu.com", path="/bawu2/platform/listMemberInfo")
+_URL_BAWU_BLOCK_CLEAR = yarl.URL.build(scheme="https", host="tieba.baidu.com", path="/mo/q/bawublockclear")
+_URL_BAWU_RECOVER_THREAD = yarl.URL.build(scheme="https", host="tieba.baidu.com", path="/mo/q/bawurecoverthread")
+_URL_BAWU_RECOVER = yarl.URL.build(scheme="https", host="tieba.baidu.com", path="/mo/q/bawurecover")
+_URL_LIST_BLACK_USER = yarl.URL.build(scheme="http", host="tieba.baidu.com", path="/bawu2/platform/listBlackUser")
+_URL_ADD_BLACK = yarl.URL.build(scheme="http", host="tieba.baidu.com", path="/bawu2/platform/addBlack")
+_URL_CANCEL_BLACK = yarl.URL.build(scheme="http", host="tieba.baidu.com", path="/bawu2/platform/cancelBlack")
+_URL_BAWU_APPEAL = yarl.URL.build(scheme="https", host="tieba.baidu.com", path="/mo/q/bawuappeal")
+_URL_BAWU_APPEAL_HANDLE = yarl.URL.build(scheme="https", host="tieba.baidu.com", path="/mo/q/bawuappealhandle")
+_URL_GET_FORUM_HOME = yarl.URL.build(scheme="https", host="tieba.baidu.com", path="/mg/o/getForumHome")
+
+# 以下为app接口的相对路径 由app/app_proto的base_url补全
+_URL_LOGIN = yarl.URL.build(path="/c/s/login")
+_URL_GET_USER_INFO = yarl.URL.build(path="/c/u/user/getuserinfo", query_string="cmd=303024")
+_URL_GET_USER_BY_TIEBA_UID = yarl.URL.build(path="/c/u/user/getUserByTiebaUid", query_string="cmd=309702")
+_URL_FRS_PAGE = yarl.URL.build(path="/c/f/frs/page", query_string="cmd=301001")
+_URL_PB_PAGE = yarl.URL.build(path="/c/f/pb/page", query_string="cmd=302001")
+_URL_PB_FLOOR = yarl.URL.build(path="/c/f/pb/floor", query_string="cmd=302002")
+_URL_SEARCH_POST = yarl.URL.build(path="/c/s/searchpost")
+_URL_GET_FORUM_DETAIL = yarl.URL.build(path="/c/f/forum/getforumdetail")
+_URL_GET_BAWU_INFO = yarl.URL.build(path="/c/f/forum/getBawuInfo", query_string="cmd=301007")
+_URL_SEARCH_POST_FORUM = yarl.URL.build(path="/c/f/forum/searchPostForum", query_string="cmd=309466")
+_URL_GET_FORUM_SQUARE = yarl.URL.build(path="/c/f/forum/getForumSquare", query_string="cmd=309653")
+_URL_PROFILE = yarl.URL.build(path="/c/u/user/profile")
+_URL_GET_FORUM_DATA = yarl.URL.build(path="/c/f/forum/getforumdata")
+_URL_GET_LIKE_FORUM = yarl.URL.build(path="/c/f/forum/like")
+_URL_GET_RECOM_THREAD_LIST = yarl.URL.build(path="/c/f/bawu/getRecomThreadList")
+_URL_GET_RECOM_THREAD_HISTORY = yarl.URL.build(path="/c/f/bawu/getRecomThreadHistory")
+_URL_COMMIT_PRISON = yarl.URL.build(path="/c/c/bawu/commitprison")
+_URL_DEL_THREAD = yarl.URL.build(path="/c/c/bawu/delthread")
+_URL_DEL_POST = yarl.URL.build(path="/c/c/bawu/delpost")
+_URL_MOVE_TAB_THREAD = yarl.URL.build(path="/c/c/bawu/moveTabThread")
+_URL_PUSH_RECOM = yarl.URL.build(path="/c/c/bawu/pushRecomToPersonalized")
+_URL_GOOD_LIST = yarl.URL.build(path="/c/c/bawu/goodlist")
+_URL_COMMIT_GOOD = yarl.URL.build(path="/c/c/bawu/commitgood")
+_URL_COMMIT_TOP = yarl.URL.build(path="/c/c/bawu/committop")
+_URL_MSG = yarl.URL.build(path="/c/s/msg")
+_URL_REPLY_ME = yarl.URL.build(path="/c/u/feed/replyme", query_string="cmd=303007")
+_URL_AT_ME = yarl.URL.build(path="/c/u/feed/atme")
+_URL_USER_POST = yarl.URL.build(path="/c/u/feed/userpost", query_string="cmd=303002")
+_URL_FANS_PAGE = yarl.URL.build(path="/c/u/fans/page")
+_URL_FOLLOW_LIST = yarl.URL.build(path="/c/u/follow/followList")
+_URL_GET_DISLIKE_LIST = yarl.URL.build(path="/c/u/user/getDislikeList", query_string="cmd=309692")
+_URL_REMOVE_FANS = yarl.URL.build(path="/c/c/user/removeFans")
+_URL_FOLLOW = yarl.URL.build(path="/c/c/user/follow")
+_URL_UNFOLLOW = yarl.URL.build(path="/c/c/user/unfollow")
+_URL_FORUM_LIKE = yarl.URL.build(path="/c/c/forum/like")
+_URL_FORUM_UNFAVOLIKE = yarl.URL.build(path="/c/c/forum/unfavolike")
+_URL_SUBMIT_DISLIKE = yarl.URL.build(path="/c/c/excellent/submitDislike")
+_URL_SUBMIT_CANCEL_DISLIKE = yarl.URL.build(path="/c/c/excellent/submitCancelDislike")
+_URL_SET_PRIVACY = yarl.URL.build(path="/c/c/thread/setPrivacy")
+_URL_FORUM_SIGN = yarl.URL.build(path="/c/c/forum/sign")
+_URL_POST_ADD = yarl.URL.build(path="/c/c/post/add")
+
+_URL_WEBSOCKET = yarl.URL.build(scheme="ws", host="im.tieba.baidu.com", port=8000)
+
 
 class WebsocketResponse(object):
     """
@@ -93,10 +380,11 @@ class WebsocketResponse(object):
     def __init__(self) -> None:
         self._timestamp: int = int(time.time())
 
-        if self._websocket_request_id is None:
-            self._websocket_request_id = self._timestamp - 1
-        self._websocket_request_id += 1
-        self._req_id = self._websocket_request_id
+        # 计数器须写回类属性 否则各实例拿到的都是同一个req_id 并发请求会在ws_res_wait_dict中互相覆盖
+        if WebsocketResponse._websocket_request_id is None:
+            WebsocketResponse._websocket_request_id = self._timestamp - 1
+        WebsocketResponse._websocket_request_id += 1
+        self._req_id = WebsocketResponse._websocket_request_id
 
         self._readable_event: asyncio.Event = asyncio.Event()
         self._data: bytes = None
@@ -166,6 +454,9 @@ class Client(object):
         '_client_id',
         '_cuid',
         '_cuid_galaxy2',
+        '_replyme_bodies',
+        '_fid_tasks',
+        '_login_task',
     ]
 
     latest_version: ClassVar[str] = "12.25.4.3"  # 这是目前的最新版本
@@ -196,17 +487,30 @@ class Client(object):
         self._cuid: str = None
         self._cuid_galaxy2: str = None
 
+        self._replyme_bodies: Dict[int, bytes] = {}
+        self._fid_tasks: Dict[str, asyncio.Task] = {}
+        self._login_task: asyncio.Task = None
+
     async def enter(self) -> "Client":
+        self._load_fid_dict()
+
         _trust_env = False
         _timeout = aiohttp.ClientTimeout(connect=8, sock_connect=3, sock_read=12)
         self._connector = aiohttp.TCPConnector(
-            ttl_dns_cache=600, keepalive_timeout=60, limit=0, family=socket.AF_INET, ssl=False
+            ttl_dns_cache=600,
+            keepalive_timeout=90,
+            limit=100,
+            limit_per_host=32,
+            family=socket.AF_INET,
+            ssl=False,
+            enable_cleanup_closed=True,
         )
 
         _app_base_url = yarl.URL.build(scheme="http", host="c.tieba.baidu.com")
         # Init app client
         app_headers = {
             aiohttp.hdrs.USER_AGENT: f"bdtb for Android {self.latest_version}",
+            aiohttp.hdrs.CONTENT_TYPE: "application/x-www-form-urlencoded",
             aiohttp.hdrs.CONNECTION: "keep-alive",
             aiohttp.hdrs.ACCEPT_ENCODING: "gzip",
             aiohttp.hdrs.HOST: "c.tieba.baidu.com",
@@ -226,6 +530,7 @@ class Client(object):
         app_proto_headers = {
             aiohttp.hdrs.USER_AGENT: f"bdtb for Android {self.latest_version}",
             "x_bd_data_type": "protobuf",
+            aiohttp.hdrs.CONTENT_TYPE: _PROTO_CONTENT_TYPE,
             aiohttp.hdrs.CONNECTION: "keep-alive",
             aiohttp.hdrs.ACCEPT_ENCODING: "gzip",
             aiohttp.hdrs.HOST: "c.tieba.baidu.com",
@@ -237,7 +542,7 @@ class Client(object):
             connector_owner=False,
             raise_for_status=True,
             timeout=_timeout,
-            read_bufsize=1 << 18,  # 256KiB
+            read_bufsize=1 << 20,  # 1MiB
             trust_env=_trust_env,
         )
 
@@ -297,9 +602,55 @@ class Client(object):
 
         await self._connector.close()
 
+        self._dump_fid_dict()
+
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         await self.close()
 
+    @classmethod
+    def _load_fid_dict(cls) -> None:
+        """
+        从本地缓存文件恢复fid_dict
+        """
+
+        try:
+            fid_dict: Dict[str, int] = orjson.loads(_FID_CACHE_PATH.read_bytes())
+            if not isinstance(fid_dict, dict) or not all(
+                isinstance(fname, str) and type(fid) is int for fname, fid in fid_dict.items()
+            ):
+                raise ValueError("fid cache is not a dict of str to int")
+            cls.fid_dict.update(fid_dict)
+
+        except FileNotFoundError:
+            pass
+        except Exception as err:
+            LOG.warning(f"Failed to load fid cache. reason:{err}")
+
+    @classmethod
+    def _dump_fid_dict(cls) -> None:
+        """
+        将fid_dict写入本地缓存文件 先写临时文件再替换以保证原子性
+        """
+
+        if not cls.fid_dict:
+            return
+
+        tmp_path = None
+        try:
+            _FID_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile('wb', dir=_FID_CACHE_PATH.parent, delete=False) as file:
+                tmp_path = file.name
+                file.write(orjson.dumps(dict(cls.fid_dict)))
+            os.replace(tmp_path, _FID_CACHE_PATH)
+
+        except Exception as err:
+            LOG.warning(f"Failed to dump fid cache. reason:{err}")
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
     @property
     def timestamp_ms(self) -> int:
         """
@@ -309,7 +660,7 @@ class Client(object):
             int: 毫秒级整数时间戳
         """
 
-        return int(time.time() * 1000)
+        return time.time_ns() // 1_000_000
 
     @property
     def client_id(self) -> str:
@@ -367,42 +718,150 @@ class Client(object):
             list[tuple[str, str]]: 签名后的form参数元组列表
         """
 
-        raw_list = [f"{k}={v}" for k, v in forms]
-        raw_list.append("tiebaclient!!!")
-        raw_str = "".join(raw_list)
-
-        md5 = hashlib.md5()
-        md5.update(raw_str.encode('utf-8'))
+        md5 = _SIGN_MD5.copy()
+        md5.update("".join([f"{k}={v}" for k, v in forms]).encode('utf-8'))
+        md5.update(_SIGN_SUFFIX)
         forms.append(('sign', md5.hexdigest()))
 
         return forms
 
     @staticmethod
-    def pack_proto_bytes(req_bytes: bytes) -> aiohttp.MultipartWriter:
+    def pack_form_bytes(forms: List[Tuple[str, str]], fixed_num: int) -> bytes:
         """
-        将req_bytes打包为贴吧客户端专用的aiohttp.MultipartWriter
+        打包form参数元组列表为带贴吧客户端签名的urlencoded请求体
+        前fixed_num项的编码结果与签名中间状态会被缓存 适用于仅有末几项随请求变化的高频接口
+        fixed_num不小于参数总数时直接缓存整个请求体
+
+        Args:
+            forms (list[tuple[str, str]]): form参数元组列表
+            fixed_num (int): 在多次请求间保持不变的前缀参数个数 至少为1
+
+        Returns:
+            bytes: 只可用于贴吧客户端
+        """
+
+        if fixed_num >= len(forms):
+            return _pack_const_form(tuple(forms))
+
+        prefix_bytes, prefix_md5 = _pack_form_prefix(tuple(forms[:fixed_num]))
+
+        forms = forms[fixed_num:]
+        md5 = prefix_md5.copy()
+        md5.update("".join([f"{k}={v}" for k, v in forms]).encode('utf-8'))
+        md5.update(_SIGN_SUFFIX)
+        forms.append(('sign', md5.hexdigest()))
+
+        return b'&'.join([prefix_bytes, urllib.parse.urlencode(forms).encode('utf-8')])
+
+    @staticmethod
+    def _pack_proto_bytes(req_bytes: bytes) -> bytes:
+        """
+        将req_bytes打包为贴吧客户端专用的multipart/form-data请求体
+        对应的Content-Type已在app_proto的默认请求头中设置
 
         Args:
             req_bytes (bytes): protobuf序列化后的二进制数据
 
         Returns:
-            aiohttp.MultipartWriter: 只可用于贴吧客户端
+            bytes: 只可用于贴吧客户端
         """
 
-        writer = aiohttp.MultipartWriter('form-data', boundary=f"*-672328094-42-{random.randint(0,9)}")
-        payload_headers = {
-            aiohttp.hdrs.CONTENT_DISPOSITION: aiohttp.helpers.content_disposition_header(
-                'form-data', name='data', filename='file'
-            )
-        }
-        payload = aiohttp.BytesPayload(req_bytes, content_type='', headers=payload_headers)
-        writer.append_payload(payload)
+        return b''.join([_PROTO_BODY_PREFIX, req_bytes, _PROTO_BODY_SUFFIX])
+
+    @staticmethod
+    async def _json(res: aiohttp.ClientResponse, *, empty_as_none: bool = False) -> dict:
+        """
+        读取响应体并解析json
+
+        Args:
+            res (aiohttp.ClientResponse): 响应
+            empty_as_none (bool, optional): 是否将json中的空值转为None 供ParseDict等使用. Defaults to False.
+
+        Returns:
+            dict: 解析后的json
+        """
+
+        raw = await res.read()
+        if empty_as_none:
+            return JSON_DECODER.decode(raw.decode('utf-8'))
+        return orjson.loads(raw)
+
+    @classmethod
+    async def _checked_json(
+        cls,
+        res: aiohttp.ClientResponse,
+        code_key: str = 'error_code',
+        msg_key: str = 'error_msg',
+        *,
+        empty_as_none: bool = False,
+    ) -> dict:
+        """
+        读取响应体并解析json 状态码非0时抛出ValueError
+
+        Args:
+            res (aiohttp.ClientResponse): 响应
+            code_key (str, optional): 状态码字段名. Defaults to 'error_code'.
+            msg_key (str, optional): 错误信息字段名. Defaults to 'error_msg'.
+            empty_as_none (bool, optional): 是否将json中的空值转为None 供ParseDict等使用. Defaults to False.
+
+        Returns:
+            dict: 解析后的json
+        """
 
-        # 删除无用参数
-        writer._parts[0][0]._headers.popone(aiohttp.hdrs.CONTENT_TYPE)
-        writer._parts[0][0]._headers.popone(aiohttp.hdrs.CONTENT_LENGTH)
+        res_json: dict = await cls._json(res, empty_as_none=empty_as_none)
+        if int(res_json[code_key]):
+            raise ValueError(res_json[msg_key])
+
+        return res_json
+
+    @staticmethod
+    async def _check_status(
+        res: aiohttp.ClientResponse, code_key: str = 'error_code', msg_key: str = 'error_msg'
+    ) -> None:
+        """
+        检查仅需返回状态的响应 状态码非0或响应体格式异常时抛出ValueError
+
+        Args:
+            res (aiohttp.ClientResponse): 响应
+            code_key (str, optional): 状态码字段名. Defaults to 'error_code'.
+            msg_key (str, optional): 错误信息字段名. Defaults to 'error_msg'.
+        """
+
+        try:
+            res_json: dict = orjson.loads(await res.read())
+            if not int(res_json[code_key]):
+                return
+            err_msg = res_json[msg_key]
+        except (KeyError, TypeError) as err:
+            raise ValueError(f"Malformed response. reason:{err!r}") from err
+
+        raise ValueError(err_msg)
+
+    @staticmethod
+    async def _read_buffer(res: aiohttp.ClientResponse) -> bytearray:
+        """
+        分块读取响应体到bytearray
+        响应体未经压缩时按Content-Length预分配缓冲区 避免读取过程中反复扩容
+        预分配大小不超过8MiB 以防伪造的Content-Length导致巨量内存分配
+
+        Args:
+            res (aiohttp.ClientResponse): 响应
+
+        Returns:
+            bytearray: 响应体
+        """
 
-        return writer
+        size = 0 if aiohttp.hdrs.CONTENT_ENCODING in res.headers else (res.content_length or 0)
+        buffer = bytearray(min(size, _READ_BUFFER_MAX_PREALLOC))
+
+        offset = 0
+        async for chunk in res.content.iter_chunked(1 << 16):
+            end = offset + len(chunk)
+            buffer[offset:end] = chunk
+            offset = end
+        del buffer[offset:]
+
+        return buffer
 
     @property
     def ws_password(self) -> bytes:
@@ -455,21 +914,19 @@ class Client(object):
             ws_bytes = gzip.compress(ws_bytes, 5)
 
         if need_encrypt:
-            pad_num = AES.block_size - (len(ws_bytes) % AES.block_size)
-            ws_bytes += pad_num.to_bytes(1, 'big') * pad_num
+            # AES.block_size为16 按PKCS#7补齐1~16字节
+            ws_bytes += _AES_PAD_LUT[15 - (len(ws_bytes) & 15)]
             ws_bytes = self.ws_aes_chiper.encrypt(ws_bytes)
 
-        flag = 0x08 | (need_gzip << 7) | (need_encrypt << 6)
-        ws_bytes = b''.join(
-            [
-                flag.to_bytes(1, 'big'),
-                cmd.to_bytes(4, 'big'),
-                req_id.to_bytes(4, 'big'),
-                ws_bytes,
-            ]
-        )
+        flag = _WS_FLAG_LUT[(need_gzip << 1) | need_encrypt]
 
-        return ws_bytes
+        res_bytes = bytearray(9 + len(ws_bytes))
+        res_bytes[0] = flag
+        res_bytes[1:5] = cmd.to_bytes(4, 'big')
+        res_bytes[5:9] = req_id.to_bytes(4, 'big')
+        res_bytes[9:] = ws_bytes
+
+        return bytes(res_bytes)
 
     def _unpack_ws_bytes(self, ws_bytes: bytes) -> Tuple[bytes, int, int]:
         """
@@ -496,7 +953,7 @@ class Client(object):
             ws_bytes = self.ws_aes_chiper.decrypt(ws_bytes)
             ws_bytes = ws_bytes.rstrip(ws_bytes[-2:-1])
         if flag & 0b01000000:
-            ws_bytes = gzip.decompress(ws_bytes)
+            ws_bytes = _gzip_decompress(ws_bytes)
 
         return ws_bytes, cmd, req_id
 
@@ -518,9 +975,7 @@ class Client(object):
             self._ws_dispatcher.cancel()
 
         try:
-            self.websocket = await self._app_websocket._ws_connect(
-                yarl.URL.build(scheme="ws", host="im.tieba.baidu.com", port=8000), heartbeat=heartbeat, ssl=False
-            )
+            self.websocket = await self._app_websocket._ws_connect(_URL_WEBSOCKET, heartbeat=heartbeat, ssl=False)
             self._ws_dispatcher = asyncio.create_task(self._ws_dispatch(), name="ws_dispatcher")
 
         except Exception as err:
@@ -635,7 +1090,7 @@ class Client(object):
         """
 
         if not self._tbs:
-            await self.login()
+            await self._login_once()
 
         return self._tbs
 
@@ -648,10 +1103,23 @@ class Client(object):
         """
 
         if self._user is None:
-            await self.login()
+            await self._login_once()
 
         return self._user
 
+    async def _login_once(self) -> bool:
+        """
+        登录 并发调用时只发出一次登录请求
+
+        Returns:
+            bool: 操作是否成功
+        """
+
+        if self._login_task is None or self._login_task.done():
+            self._login_task = asyncio.create_task(self.login())
+
+        return await asyncio.shield(self._login_task)
+
     async def login(self) -> bool:
         """
         登录并获取tbs以及当前账号信息
@@ -667,16 +1135,19 @@ class Client(object):
 
         try:
             res = await self.app.post(
-                yarl.URL.build(path="/c/s/login"),
+                _URL_LOGIN,
                 data=self.pack_form(payload),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            res_json: dict = await self._checked_json(res)
 
-            user_dict = res_json['user']
-            user_proto = ParseDict(user_dict, User_pb2.User(), ignore_unknown_fields=True)
+            # BasicUserInfo只读取以下字段 无需ParseDict完整解析
+            user_dict: dict = res_json['user']
+            user_proto = User_pb2.User()
+            user_proto.id = int(user_dict.get('id') or 0)
+            user_proto.name = user_dict.get('name') or ''
+            user_proto.name_show = user_dict.get('name_show') or ''
+            user_proto.portrait = user_dict.get('portrait') or ''
             self._user = BasicUserInfo(_raw_data=user_proto)
             self._tbs = res_json['anti']['tbs']
 
@@ -702,15 +1173,28 @@ class Client(object):
         if fid := self.fid_dict.get(fname, 0):
             return fid
 
+        # 合并对同一贴吧名的并发查询
+        if (task := self._fid_tasks.get(fname)) is None:
+            task = self._fid_tasks[fname] = asyncio.create_task(self._fname2fid(fname))
+            task.add_done_callback(lambda _: self._fid_tasks.pop(fname, None))
+
+        return await asyncio.shield(task)
+
+    async def _fname2fid(self, fname: str) -> int:
+        """
+        通过贴吧名获取fid 并写入fid_dict
+
+        Args:
+            fname (str): 贴吧名
+
+        Returns:
+            int: 该贴吧的forum_id
+        """
+
         try:
-            res = await self.web.get(
-                yarl.URL.build(scheme="http", host="tieba.baidu.com", path="/f/commit/share/fnameShareApi"),
-                params={'fname': fname, 'ie': 'utf-8'},
-            )
+            res = await self.web.get(_URL_FNAME2FID.with_query({'fname': fname, 'ie': 'utf-8'}))
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['no']):
-                raise ValueError(res_json['error'])
+            res_json: dict = await self._checked_json(res, 'no', 'error')
 
             if fid := int(res_json['data']['fid']):
                 self.fid_dict[fname] = fid
@@ -785,16 +1269,15 @@ class Client(object):
 
         try:
             res = await self.web.get(
-                yarl.URL.build(scheme="https", host="tieba.baidu.com", path="/home/get/panel"),
-                params={
-                    'id': user.portrait,
-                    'un': user.user_name or user.nick_name,
-                },
+                _URL_USER_PANEL.with_query(
+                    {
+                        'id': user.portrait,
+                        'un': user.user_name or user.nick_name,
+                    }
+                )
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['no']):
-                raise ValueError(res_json['error'])
+            res_json: dict = await self._checked_json(res, 'no', 'error')
 
             user_dict: dict = res_json['data']
 
@@ -832,16 +1315,15 @@ class Client(object):
 
         try:
             res = await self.web.get(
-                yarl.URL.build(scheme="https", host="tieba.baidu.com", path="/home/get/panel"),
-                params={
-                    'id': user.portrait,
-                    'un': user.user_name or user.nick_name,
-                },
+                _URL_USER_PANEL.with_query(
+                    {
+                        'id': user.portrait,
+                        'un': user.user_name or user.nick_name,
+                    }
+                )
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['no']):
-                raise ValueError(res_json['error'])
+            res_json: dict = await self._checked_json(res, 'no', 'error')
 
             user_dict = res_json['data']
             user.user_name = user_dict['name']
@@ -868,15 +1350,15 @@ class Client(object):
 
         try:
             res = await self.web.get(
-                yarl.URL.build(scheme="http", host="tieba.baidu.com", path="/i/sys/user_json"),
-                params={
-                    'un': user.user_name,
-                    'ie': 'utf-8',
-                },
+                _URL_USER_JSON.with_query(
+                    {
+                        'un': user.user_name,
+                        'ie': 'utf-8',
+                    }
+                )
             )
 
-            text = await res.text(encoding='utf-8', errors='ignore')
-            res_json = json.loads(text)
+            res_json = orjson.loads(await res.text(encoding='utf-8', errors='ignore'))
             if not res_json:
                 raise ValueError("empty response")
 
@@ -910,8 +1392,8 @@ class Client(object):
 
         try:
             res = await self.app_proto.post(
-                yarl.URL.build(path="/c/u/user/getuserinfo", query_string="cmd=303024"),
-                data=self.pack_proto_bytes(req_proto.SerializeToString()),
+                _URL_GET_USER_INFO,
+                data=self._pack_proto_bytes(req_proto.SerializeToString()),
             )
 
             res_proto = GetUserInfoResIdl_pb2.GetUserInfoResIdl()
@@ -940,14 +1422,9 @@ class Client(object):
         """
 
         try:
-            res = await self.web.get(
-                yarl.URL.build(scheme="http", host="tieba.baidu.com", path="/im/pcmsg/query/getUserInfo"),
-                params={'chatUid': user.user_id},
-            )
+            res = await self.web.get(_URL_CHAT_USER_INFO.with_query({'chatUid': user.user_id}))
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['errno']):
-                raise ValueError(res_json['errmsg'])
+            res_json: dict = await self._checked_json(res, 'errno', 'errmsg')
 
             user_dict = res_json['chatUser']
             user.user_name = user_dict['uname']
@@ -979,8 +1456,8 @@ class Client(object):
 
         try:
             res = await self.app_proto.post(
-                yarl.URL.build(path="/c/u/user/getUserByTiebaUid", query_string="cmd=309702"),
-                data=self.pack_proto_bytes(req_proto.SerializeToString()),
+                _URL_GET_USER_BY_TIEBA_UID,
+                data=self._pack_proto_bytes(req_proto.SerializeToString()),
             )
 
             res_proto = GetUserByTiebaUidResIdl_pb2.GetUserByTiebaUidResIdl()
@@ -1031,8 +1508,8 @@ class Client(object):
 
         try:
             res = await self.app_proto.post(
-                yarl.URL.build(path="/c/f/frs/page", query_string="cmd=301001"),
-                data=self.pack_proto_bytes(req_proto.SerializeToString()),
+                _URL_FRS_PAGE,
+                data=self._pack_proto_bytes(req_proto.SerializeToString()),
             )
 
             res_proto = FrsPageResIdl_pb2.FrsPageResIdl()
@@ -1099,8 +1576,8 @@ class Client(object):
 
         try:
             res = await self.app_proto.post(
-                yarl.URL.build(path="/c/f/pb/page", query_string="cmd=302001"),
-                data=self.pack_proto_bytes(req_proto.SerializeToString()),
+                _URL_PB_PAGE,
+                data=self._pack_proto_bytes(req_proto.SerializeToString()),
             )
 
             res_proto = PbPageResIdl_pb2.PbPageResIdl()
@@ -1145,8 +1622,8 @@ class Client(object):
 
         try:
             res = await self.app_proto.post(
-                yarl.URL.build(path="/c/f/pb/floor", query_string="cmd=302002"),
-                data=self.pack_proto_bytes(req_proto.SerializeToString()),
+                _URL_PB_FLOOR,
+                data=self._pack_proto_bytes(req_proto.SerializeToString()),
             )
 
             res_proto = PbFloorResIdl_pb2.PbFloorResIdl()
@@ -1202,13 +1679,11 @@ class Client(object):
 
         try:
             res = await self.app.post(
-                yarl.URL.build(path="/c/s/searchpost"),
+                _URL_SEARCH_POST,
                 data=self.pack_form(payload),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', loads=JSON_DECODER.decode, content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            res_json: dict = await self._checked_json(res, empty_as_none=True)
 
             searches = Searches(res_json)
 
@@ -1238,13 +1713,11 @@ class Client(object):
 
         try:
             res = await self.app.post(
-                yarl.URL.build(path="/c/f/forum/getforumdetail"),
-                data=self.pack_form(payload),
+                _URL_GET_FORUM_DETAIL,
+                data=self.pack_form_bytes(payload, len(payload)),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            res_json: dict = await self._checked_json(res)
 
             fname = res_json['forum_info']['forum_name']
             member_num = int(res_json['forum_info']['member_count'])
@@ -1271,22 +1744,20 @@ class Client(object):
 
         fid = fname_or_fid if isinstance(fname_or_fid, int) else await self.get_fid(fname_or_fid)
 
-        common_proto = CommonReq_pb2.CommonReq()
-        common_proto._client_version = self.latest_version
-        data_proto = GetBawuInfoReqIdl_pb2.GetBawuInfoReqIdl.DataReq()
-        data_proto.common.CopyFrom(common_proto)
-        data_proto.forum_id = fid
-        req_proto = GetBawuInfoReqIdl_pb2.GetBawuInfoReqIdl()
-        req_proto.data.CopyFrom(data_proto)
+        # 等价于GetBawuInfoReqIdl{data: {common: {_client_version}, forum_id(2): fid}}
+        data_bytes = _serialize_common_field('', self.latest_version)
+        if fid:
+            data_bytes += b'\x10' + _encode_varint(fid)
+        req_bytes = _pack_len_field(b'\x0a', data_bytes)
 
         try:
             res = await self.app_proto.post(
-                yarl.URL.build(path="/c/f/forum/getBawuInfo", query_string="cmd=301007"),
-                data=self.pack_proto_bytes(req_proto.SerializeToString()),
+                _URL_GET_BAWU_INFO,
+                data=self._pack_proto_bytes(req_bytes),
             )
 
             res_proto = GetBawuInfoResIdl_pb2.GetBawuInfoResIdl()
-            res_proto.ParseFromString(await res.content.read())
+            res_proto.ParseFromString(await self._read_buffer(res))
             if int(res_proto.error.errorno):
                 raise ValueError(res_proto.error.errmsg)
 
@@ -1317,23 +1788,20 @@ class Client(object):
 
         fname = fname_or_fid if isinstance(fname_or_fid, str) else await self.get_fname(fname_or_fid)
 
-        common_proto = CommonReq_pb2.CommonReq()
-        common_proto.BDUSS = self.BDUSS
-        common_proto._client_version = self.latest_version
-        data_proto = SearchPostForumReqIdl_pb2.SearchPostForumReqIdl.DataReq()
-        data_proto.common.CopyFrom(common_proto)
-        data_proto.word = fname
-        req_proto = SearchPostForumReqIdl_pb2.SearchPostForumReqIdl()
-        req_proto.data.CopyFrom(data_proto)
+        # 等价于SearchPostForumReqIdl{data: {common: {BDUSS, _client_version}, word(2): fname}}
+        data_bytes = _serialize_common_field(self.BDUSS, self.latest_version)
+        if fname:
+            data_bytes += _pack_len_field(b'\x12', fname.encode('utf-8'))
+        req_bytes = _pack_len_field(b'\x0a', data_bytes)
 
         try:
             res = await self.app_proto.post(
-                yarl.URL.build(path="/c/f/forum/searchPostForum", query_string="cmd=309466"),
-                data=self.pack_proto_bytes(req_proto.SerializeToString()),
+                _URL_SEARCH_POST_FORUM,
+                data=self._pack_proto_bytes(req_bytes),
             )
 
             res_proto = SearchPostForumResIdl_pb2.SearchPostForumResIdl()
-            res_proto.ParseFromString(await res.content.read())
+            res_proto.ParseFromString(await self._read_buffer(res))
             if int(res_proto.error.errorno):
                 raise ValueError(res_proto.error.errmsg)
 
@@ -1345,6 +1813,36 @@ class Client(object):
 
         return tab_map
 
+    async def get_forum_bundle(
+        self, fname_or_fid: Union[str, int]
+    ) -> Tuple[Tuple[str, int, int], Dict[str, List[BasicUserInfo]], Dict[str, int]]:
+        """
+        并发获取贴吧信息 吧务信息和分区映射
+
+        Args:
+            fname_or_fid (str | int): 目标贴吧名或fid
+
+        Returns:
+            tuple[tuple[str, int, int], dict[str, list[BasicUserInfo]], dict[str, int]]: get_forum_detail, get_bawu_dict, get_tab_map的返回值
+        """
+
+        if isinstance(fname_or_fid, str):
+            # get_tab_map只需贴吧名 与fid查询并发进行
+            fid, tab_map = await asyncio.gather(self.get_fid(fname_or_fid), self.get_tab_map(fname_or_fid))
+            if not fid:
+                return ('', 0, 0), {}, {}
+            detail, bawu_dict = await asyncio.gather(self.get_forum_detail(fid), self.get_bawu_dict(fid))
+        else:
+            if not fname_or_fid:
+                return ('', 0, 0), {}, {}
+            # 贴吧名取自get_forum_detail的结果 避免重复请求
+            detail, bawu_dict = await asyncio.gather(
+                self.get_forum_detail(fname_or_fid), self.get_bawu_dict(fname_or_fid)
+            )
+            tab_map = await self.get_tab_map(detail[0]) if detail[0] else {}
+
+        return detail, bawu_dict, tab_map
+
     async def get_rank_list(
         self, fname_or_fid: Union[str, int], /, pn: int = 1
     ) -> Tuple[List[Tuple[str, int, int, bool]], bool]:
@@ -1363,7 +1861,7 @@ class Client(object):
 
         try:
             res = await self.web.get(
-                yarl.URL.build(scheme="http", host="tieba.baidu.com", path="/f/like/furank"),
+                _URL_FURANK,
                 params={
                     'kw': fname,
                     'pn': pn,
@@ -1371,18 +1869,16 @@ class Client(object):
                 },
             )
 
-            soup = BeautifulSoup(await res.text(), 'lxml')
-            items = soup.select('tr[class^=drl_list_item]')
+            items = _XPATH_RANK_ITEM(etree.HTML(await res.text()))
 
             def _parse_item(item):
-                user_name_item = item.td.next_sibling
-                user_name = user_name_item.text
-                is_vip = 'drl_item_vip' in user_name_item.div['class']
-                level_item = user_name_item.next_sibling
-                # e.g. get level 16 from string "bg_lv16" by slicing [5:]
-                level = int(level_item.div['class'][0][5:])
-                exp_item = level_item.next_sibling
-                exp = int(exp_item.text)
+                _, user_name_item, level_item, exp_item = item.findall('td')[:4]
+                user_name = ''.join(user_name_item.itertext())
+                is_vip = 'drl_item_vip' in user_name_item.find('.//div').get('class', '').split()
+                # e.g. get level 16 from class "bg_lv16 ..."
+                level_class = level_item.find('.//div').get('class')
+                level = int(level_class.partition('bg_lv')[2].split(' ', 1)[0])
+                exp = int(''.join(exp_item.itertext()))
 
                 return user_name, level, exp, is_vip
 
@@ -1414,7 +1910,7 @@ class Client(object):
 
         try:
             res = await self.web.get(
-                yarl.URL.build(scheme="http", host="tieba.baidu.com", path="/bawu2/platform/listMemberInfo"),
+                _URL_LIST_MEMBER_INFO,
                 params={
                     'word': fname,
                     'pn': pn,
@@ -1422,15 +1918,14 @@ class Client(object):
                 },
             )
 
-            soup = BeautifulSoup(await res.text(), 'lxml')
-            items = soup.find_all('div', class_='name_wrap')
+            items = _XPATH_MEMBER_ITEM(etree.HTML(await res.text()))
 
             def _parse_item(item):
-                user_item = item.a
-                user_name = user_item['title']
-                portrait = user_item['href'][14:]
-                level_item = item.span
-                level = int(level_item['class'][1][12:])
+                user_item = item.find('.//a')
+                user_name = user_item.get('title')
+                portrait = user_item.get('href')[14:]
+                level_item = item.find('.//span')
+                level = int(level_item.get('class').split()[1][12:])
                 return user_name, portrait, level
 
             res_list = [_parse_item(item) for item in items]
@@ -1471,8 +1966,8 @@ class Client(object):
 
         try:
             res = await self.app_proto.post(
-                yarl.URL.build(path="/c/f/forum/getForumSquare", query_string="cmd=309653"),
-                data=self.pack_proto_bytes(req_proto.SerializeToString()),
+                _URL_GET_FORUM_SQUARE,
+                data=self._pack_proto_bytes(req_proto.SerializeToString()),
             )
 
             res_proto = GetForumSquareResIdl_pb2.GetForumSquareResIdl()
@@ -1519,13 +2014,11 @@ class Client(object):
 
         try:
             res = await self.app.post(
-                yarl.URL.build(path="/c/u/user/profile"),
+                _URL_PROFILE,
                 data=self.pack_form(payload),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', loads=JSON_DECODER.decode, content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            res_json: dict = await self._checked_json(res, empty_as_none=True)
             if not res_json.__contains__('user'):
                 raise ValueError("invalid params")
 
@@ -1536,7 +2029,7 @@ class Client(object):
         user = UserInfo(_raw_data=ParseDict(res_json['user'], User_pb2.User(), ignore_unknown_fields=True))
 
         def _pack_thread_dict(thread_dict: dict) -> NewThread:
-            thread = NewThread(ParseDict(thread_dict, NewThreadInfo_pb2.NewThreadInfo(), ignore_unknown_fields=True))
+            thread = NewThread(_parse_dict_fields(thread_dict, NewThreadInfo_pb2.NewThreadInfo(), _NEW_THREAD_FIELDS))
             thread._user = user
             return thread
 
@@ -1571,35 +2064,23 @@ class Client(object):
             ('forum_id', fid),
         ]
 
-        field_names = [
-            'view',
-            'thread',
-            'new_member',
-            'post',
-            'sign_ratio',
-            'average_time',
-            'average_times',
-            'recommend',
-        ]
         try:
             res = await self.app.post(
-                yarl.URL.build(path="/c/f/forum/getforumdata"),
-                data=self.pack_form(payload),
+                _URL_GET_FORUM_DATA,
+                data=self.pack_form_bytes(payload, len(payload)),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            res_json: dict = await self._checked_json(res)
 
             data = res_json['data']
             stat = {
-                field_name: [int(item['value']) for item in reversed(data_i['group'][1]['values'])]
-                for field_name, data_i in zip(field_names, data)
+                field_name: [int(item['value']) for item in data_i['group'][1]['values'][::-1]]
+                for field_name, data_i in zip(_STATISTICS_FIELDS, data)
             }
 
         except Exception as err:
             LOG.warning(f"Failed to get statistics of {fname_or_fid}. reason:{err}")
-            stat = {field_name: [] for field_name in field_names}
+            stat = {field_name: [] for field_name in _STATISTICS_FIELDS}
 
         return stat
 
@@ -1619,23 +2100,8 @@ class Client(object):
         else:
             user = BasicUserInfo(_id)
 
-        payload = [
-            ('BDUSS', self.BDUSS),
-            ('friend_uid', user.user_id),
-        ]
-
         try:
-            res = await self.app.post(
-                yarl.URL.build(path="/c/f/forum/like"),
-                data=self.pack_form(payload),
-            )
-
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
-
-            forums: list[dict] = res_json.get('forum_list', [])
-
+            forums = await self._get_like_forums(user.user_id)
             res_list = [
                 (forum['name'], int(forum['id']), int(forum['level_id']), int(forum['cur_score'])) for forum in forums
             ]
@@ -1646,6 +2112,68 @@ class Client(object):
 
         return res_list
 
+    async def get_forum_list_columns(
+        self, _id: Union[str, int]
+    ) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+        """
+        获取用户关注贴吧列表 按列返回
+        适用于关注数较多且仅需排序或聚合的场景
+
+        Args:
+            _id (str | int): 待获取用户的id user_id/user_name/portrait 优先user_id
+
+        Returns:
+            tuple[list[str], np.ndarray, np.ndarray, np.ndarray]: 贴吧名列表, 贴吧id数组, 等级数组, 经验值数组 数组类型均为int64
+        """
+
+        if not BasicUserInfo.is_user_id(_id):
+            user = await self.get_basic_user_info(_id)
+        else:
+            user = BasicUserInfo(_id)
+
+        try:
+            forums = await self._get_like_forums(user.user_id)
+            num = len(forums)
+            fnames = [forum['name'] for forum in forums]
+            fids = np.fromiter(map(int, (forum['id'] for forum in forums)), dtype=np.int64, count=num)
+            levels = np.fromiter(map(int, (forum['level_id'] for forum in forums)), dtype=np.int64, count=num)
+            exps = np.fromiter(map(int, (forum['cur_score'] for forum in forums)), dtype=np.int64, count=num)
+
+        except Exception as err:
+            LOG.warning(f"Failed to get forum_list of {user.user_id}. reason:{err}")
+            fnames = []
+            fids = np.empty(0, dtype=np.int64)
+            levels = np.empty(0, dtype=np.int64)
+            exps = np.empty(0, dtype=np.int64)
+
+        return fnames, fids, levels, exps
+
+    async def _get_like_forums(self, user_id: int) -> List[dict]:
+        """
+        获取用户关注贴吧列表的原始json
+
+        Args:
+            user_id (int): 待获取用户的user_id
+
+        Returns:
+            list[dict]: 关注贴吧信息列表
+        """
+
+        payload = [
+            ('BDUSS', self.BDUSS),
+            ('friend_uid', user_id),
+        ]
+
+        res = await self.app.post(
+            _URL_GET_LIKE_FORUM,
+            data=self.pack_form_bytes(payload, len(payload)),
+        )
+
+        res_json: dict = await self._checked_json(res)
+        forums: List[dict] = res_json.get('forum_list', [])
+
+        return forums
+
     async def get_recom_status(self, fname_or_fid: Union[str, int]) -> Tuple[int, int]:
         """
         获取大吧主推荐功能的月度配额状态
@@ -1669,13 +2197,11 @@ class Client(object):
 
         try:
             res = await self.app.post(
-                yarl.URL.build(path="/c/f/bawu/getRecomThreadList"),
-                data=self.pack_form(payload),
+                _URL_GET_RECOM_THREAD_LIST,
+                data=self.pack_form_bytes(payload, len(payload)),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            res_json: dict = await self._checked_json(res)
 
             total_recom_num = int(res_json['total_recommend_num'])
             used_recom_num = int(res_json['used_recommend_num'])
@@ -1713,17 +2239,15 @@ class Client(object):
 
         try:
             res = await self.app.post(
-                yarl.URL.build(path="/c/f/bawu/getRecomThreadHistory"),
+                _URL_GET_RECOM_THREAD_HISTORY,
                 data=self.pack_form(payload),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', loads=JSON_DECODER.decode, content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            res_json: dict = await self._checked_json(res, empty_as_none=True)
 
             def _pack_data_dict(data_dict):
                 thread_dict = data_dict['thread_list']
-                thread = Thread(ParseDict(thread_dict, ThreadInfo_pb2.ThreadInfo(), ignore_unknown_fields=True))
+                thread = Thread(_parse_dict_fields(thread_dict, ThreadInfo_pb2.ThreadInfo(), _THREAD_FIELDS))
                 add_view = thread.view_num - int(data_dict['current_pv'])
                 return thread, add_view
 
@@ -1755,10 +2279,10 @@ class Client(object):
 
         if isinstance(fname_or_fid, str):
             fname = fname_or_fid
-            fid = await self.get_fid(fname)
+            fid, tbs = await asyncio.gather(self.get_fid(fname), self.get_tbs())
         else:
             fid = fname_or_fid
-            fname = await self.get_fname(fid)
+            fname, tbs = await asyncio.gather(self.get_fname(fid), self.get_tbs())
 
         payload = [
             ('BDUSS', self.BDUSS),
@@ -1768,7 +2292,7 @@ class Client(object):
             ('ntn', 'banid'),
             ('portrait', user.portrait),
             ('reason', reason),
-            ('tbs', await self.get_tbs()),
+            ('tbs', tbs),
             ('un', user.user_name),
             ('word', fname),
             ('z', '42'),
@@ -1776,15 +2300,13 @@ class Client(object):
 
         try:
             res = await self.app.post(
-                yarl.URL.build(path="/c/c/bawu/commitprison"),
+                _URL_COMMIT_PRISON,
                 data=self.pack_form(payload),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            await self._check_status(res)
 
-        except Exception as err:
+        except _STATUS_ERRORS as err:
             LOG.warning(f"Failed to block {user.log_name} in {fname}. reason:{err}")
             return False
 
@@ -1805,10 +2327,10 @@ class Client(object):
 
         if isinstance(fname_or_fid, str):
             fname = fname_or_fid
-            fid = await self.get_fid(fname)
+            fid, tbs = await asyncio.gather(self.get_fid(fname), self.get_tbs())
         else:
             fid = fname_or_fid
-            fname = await self.get_fname(fid)
+            fname, tbs = await asyncio.gather(self.get_fname(fid), self.get_tbs())
 
         payload = [
             ('fn', fname),
@@ -1816,20 +2338,18 @@ class Client(object):
             ('block_un', user.user_name),
             ('block_uid', user.user_id),
             ('block_nickname', user.nick_name),
-            ('tbs', await self.get_tbs()),
+            ('tbs', tbs),
         ]
 
         try:
             res = await self.web.post(
-                yarl.URL.build(scheme="https", host="tieba.baidu.com", path="/mo/q/bawublockclear"),
+                _URL_BAWU_BLOCK_CLEAR,
                 data=payload,
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['no']):
-                raise ValueError(res_json['error'])
+            await self._check_status(res, 'no', 'error')
 
-        except Exception as err:
+        except _STATUS_ERRORS as err:
             LOG.warning(f"Failed to unblock {user.log_name} in {fname}. reason:{err}")
             return False
 
@@ -1877,27 +2397,28 @@ class Client(object):
             bool: 操作是否成功
         """
 
-        fid = fname_or_fid if isinstance(fname_or_fid, int) else await self.get_fid(fname_or_fid)
+        if isinstance(fname_or_fid, int):
+            fid, tbs = fname_or_fid, await self.get_tbs()
+        else:
+            fid, tbs = await asyncio.gather(self.get_fid(fname_or_fid), self.get_tbs())
 
         payload = [
             ('BDUSS', self.BDUSS),
             ('fid', fid),
             ('is_frs_mask', int(is_hide)),
-            ('tbs', await self.get_tbs()),
+            ('tbs', tbs),
             ('z', tid),
         ]
 
         try:
             res = await self.app.post(
-                yarl.URL.build(path="/c/c/bawu/delthread"),
-                data=self.pack_form(payload),
+                _URL_DEL_THREAD,
+                data=self.pack_form_bytes(payload, 4),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            await self._check_status(res)
 
-        except Exception as err:
+        except _STATUS_ERRORS as err:
             LOG.warning(f"Failed to delete thread tid:{tid} is_hide:{is_hide} in {fname_or_fid}. reason:{err}")
             return False
 
@@ -1917,27 +2438,28 @@ class Client(object):
             bool: 操作是否成功
         """
 
-        fid = fname_or_fid if isinstance(fname_or_fid, int) else await self.get_fid(fname_or_fid)
+        if isinstance(fname_or_fid, int):
+            fid, tbs = fname_or_fid, await self.get_tbs()
+        else:
+            fid, tbs = await asyncio.gather(self.get_fid(fname_or_fid), self.get_tbs())
 
         payload = [
             ('BDUSS', self.BDUSS),
             ('fid', fid),
             ('pid', pid),
-            ('tbs', await self.get_tbs()),
+            ('tbs', tbs),
             ('z', tid),
         ]
 
         try:
             res = await self.app.post(
-                yarl.URL.build(path="/c/c/bawu/delpost"),
-                data=self.pack_form(payload),
+                _URL_DEL_POST,
+                data=self.pack_form_bytes(payload, 2),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            await self._check_status(res)
 
-        except Exception as err:
+        except _STATUS_ERRORS as err:
             LOG.warning(f"Failed to delete post {pid} in {tid} in {fname_or_fid}. reason:{err}")
             return False
 
@@ -2018,21 +2540,58 @@ class Client(object):
 
         try:
             res = await self.web.post(
-                yarl.URL.build(scheme="https", host="tieba.baidu.com", path="/mo/q/bawurecoverthread"),
+                _URL_BAWU_RECOVER_THREAD,
                 data=payload,
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['no']):
-                raise ValueError(res_json['error'])
+            await self._check_status(res, 'no', 'error')
 
-        except Exception as err:
+        except _STATUS_ERRORS as err:
             LOG.warning(f"Failed to recover tid:{tid} pid:{pid} hide:{is_hide} in {fname}. reason:{err}")
             return False
 
         LOG.info(f"Successfully recovered tid:{tid} pid:{pid} hide:{is_hide} in {fname}")
         return True
 
+    async def recover_many(
+        self,
+        fname_or_fid: Union[str, int],
+        items: List[Tuple[int, int, bool]],
+        *,
+        concurrency: int = 32,
+    ) -> List[bool]:
+        """
+        并发恢复多个帖子
+
+        Args:
+            fname_or_fid (str | int): 帖子所在贴吧的贴吧名或fid
+            items (list[tuple[int, int, bool]]): list[tid,pid,是否为屏蔽] 可直接传入get_recover_list的返回值
+            concurrency (int, optional): 最大并发请求数. Defaults to 32.
+
+        Returns:
+            list[bool]: 与items一一对应的操作是否成功
+        """
+
+        # 预先解析贴吧名和fid 使并发的请求不再重复查询
+        if isinstance(fname_or_fid, str):
+            fname = fname_or_fid
+            fid = await self.get_fid(fname)
+        else:
+            fid = fname_or_fid
+            fname = await self.get_fname(fid)
+
+        if not (fname and fid):
+            LOG.warning(f"Failed to recover {len(items)} items in {fname_or_fid}. reason:forum not found")
+            return [False] * len(items)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _recover(tid: int, pid: int, is_hide: bool) -> bool:
+            async with semaphore:
+                return await self._recover(fname, tid, pid, is_hide)
+
+        return await asyncio.gather(*[_recover(tid, pid, is_hide) for tid, pid, is_hide in items])
+
     async def move(self, fname_or_fid: Union[str, int], tid: int, to_tab_id: int, from_tab_id: int = 0) -> bool:
         """
         将主题帖移动至另一分区
@@ -2047,27 +2606,31 @@ class Client(object):
             bool: 操作是否成功
         """
 
-        fid = fname_or_fid if isinstance(fname_or_fid, int) else await self.get_fid(fname_or_fid)
+        if isinstance(fname_or_fid, int):
+            fid, tbs = fname_or_fid, await self.get_tbs()
+        else:
+            fid, tbs = await asyncio.gather(self.get_fid(fname_or_fid), self.get_tbs())
 
         payload = [
             ('BDUSS', self.BDUSS),
             ('_client_version', self.latest_version),
             ('forum_id', fid),
-            ('tbs', await self.get_tbs()),
-            ('threads', json.dumps([{'thread_id', tid, 'from_tab_id', from_tab_id, 'to_tab_id', to_tab_id}])),
+            ('tbs', tbs),
+            (
+                'threads',
+                orjson.dumps([{'thread_id': tid, 'from_tab_id': from_tab_id, 'to_tab_id': to_tab_id}]).decode('utf-8'),
+            ),
         ]
 
         try:
             res = await self.app.post(
-                yarl.URL.build(path="/c/c/bawu/moveTabThread"),
+                _URL_MOVE_TAB_THREAD,
                 data=self.pack_form(payload),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            await self._check_status(res)
 
-        except Exception as err:
+        except _STATUS_ERRORS as err:
             LOG.warning(f"Failed to move {tid} to tab:{to_tab_id} in {fname_or_fid}. reason:{err}")
             return False
 
@@ -2096,13 +2659,11 @@ class Client(object):
 
         try:
             res = await self.app.post(
-                yarl.URL.build(path="/c/c/bawu/pushRecomToPersonalized"),
+                _URL_PUSH_RECOM,
                 data=self.pack_form(payload),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            res_json: dict = await self._checked_json(res)
             if int(res_json['data']['is_push_success']) != 1:
                 raise ValueError(res_json['data']['msg'])
 
@@ -2126,13 +2687,6 @@ class Client(object):
             bool: 操作是否成功
         """
 
-        if isinstance(fname_or_fid, str):
-            fname = fname_or_fid
-            fid = await self.get_fid(fname)
-        else:
-            fid = fname_or_fid
-            fname = await self.get_fname(fid)
-
         async def _cname2cid() -> int:
             """
             由加精分区名cname获取cid
@@ -2145,6 +2699,9 @@ class Client(object):
                 int: cname对应的分区id
             """
 
+            if not cname:
+                return 0
+
             payload = [
                 ('BDUSS', self.BDUSS),
                 ('word', fname),
@@ -2152,13 +2709,11 @@ class Client(object):
 
             try:
                 res = await self.app.post(
-                    yarl.URL.build(path="/c/c/bawu/goodlist"),
+                    _URL_GOOD_LIST,
                     data=self.pack_form(payload),
                 )
 
-                res_json: dict = await res.json(encoding='utf-8', content_type=None)
-                if int(res_json['error_code']):
-                    raise ValueError(res_json['error_msg'])
+                res_json: dict = await self._checked_json(res)
 
                 cid = 0
                 for item in res_json['cates']:
@@ -2181,6 +2736,8 @@ class Client(object):
 
             Closure Args:
                 fname (str): 帖子所在贴吧名
+                fid (int): 帖子所在贴吧的fid
+                tbs (str): 贴吧反csrf校验码tbs
 
             Returns:
                 bool: 操作是否成功
@@ -2191,29 +2748,35 @@ class Client(object):
                 ('cid', cid),
                 ('fid', fid),
                 ('ntn', 'set'),
-                ('tbs', await self.get_tbs()),
+                ('tbs', tbs),
                 ('word', fname),
                 ('z', tid),
             ]
 
             try:
                 res = await self.app.post(
-                    yarl.URL.build(path="/c/c/bawu/commitgood"),
-                    data=self.pack_form(payload),
+                    _URL_COMMIT_GOOD,
+                    data=self.pack_form_bytes(payload, 6),
                 )
 
-                res_json: dict = await res.json(encoding='utf-8', content_type=None)
-                if int(res_json['error_code']):
-                    raise ValueError(res_json['error_msg'])
+                await self._check_status(res)
 
-            except Exception as err:
+            except _STATUS_ERRORS as err:
                 LOG.warning(f"Failed to add {tid} to good_list:{cname} in {fname}. reason:{err}")
                 return False
 
             LOG.info(f"Successfully added {tid} to good_list:{cname} in {fname}")
             return True
 
-        return await _good(await _cname2cid())
+        if isinstance(fname_or_fid, str):
+            fname = fname_or_fid
+            cid, fid, tbs = await asyncio.gather(_cname2cid(), self.get_fid(fname), self.get_tbs())
+        else:
+            fid = fname_or_fid
+            fname, tbs = await asyncio.gather(self.get_fname(fid), self.get_tbs())
+            cid = await _cname2cid()
+
+        return await _good(cid)
 
     async def ungood(self, fname_or_fid: Union[str, int], tid: int) -> bool:
         """
@@ -2229,30 +2792,28 @@ class Client(object):
 
         if isinstance(fname_or_fid, str):
             fname = fname_or_fid
-            fid = await self.get_fid(fname)
+            fid, tbs = await asyncio.gather(self.get_fid(fname), self.get_tbs())
         else:
             fid = fname_or_fid
-            fname = await self.get_fname(fid)
+            fname, tbs = await asyncio.gather(self.get_fname(fid), self.get_tbs())
 
         payload = [
             ('BDUSS', self.BDUSS),
             ('fid', fid),
-            ('tbs', await self.get_tbs()),
+            ('tbs', tbs),
             ('word', fname),
             ('z', tid),
         ]
 
         try:
             res = await self.app.post(
-                yarl.URL.build(path="/c/c/bawu/commitgood"),
-                data=self.pack_form(payload),
+                _URL_COMMIT_GOOD,
+                data=self.pack_form_bytes(payload, 4),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            await self._check_status(res)
 
-        except Exception as err:
+        except _STATUS_ERRORS as err:
             LOG.warning(f"Failed to remove {tid} from good_list in {fname}. reason:{err}")
             return False
 
@@ -2273,31 +2834,29 @@ class Client(object):
 
         if isinstance(fname_or_fid, str):
             fname = fname_or_fid
-            fid = await self.get_fid(fname)
+            fid, tbs = await asyncio.gather(self.get_fid(fname), self.get_tbs())
         else:
             fid = fname_or_fid
-            fname = await self.get_fname(fid)
+            fname, tbs = await asyncio.gather(self.get_fname(fid), self.get_tbs())
 
         payload = [
             ('BDUSS', self.BDUSS),
             ('fid', fid),
             ('ntn', 'set'),
-            ('tbs', await self.get_tbs()),
+            ('tbs', tbs),
             ('word', fname),
             ('z', tid),
         ]
 
         try:
             res = await self.app.post(
-                yarl.URL.build(path="/c/c/bawu/committop"),
-                data=self.pack_form(payload),
+                _URL_COMMIT_TOP,
+                data=self.pack_form_bytes(payload, 5),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            await self._check_status(res)
 
-        except Exception as err:
+        except _STATUS_ERRORS as err:
             LOG.warning(f"Failed to add {tid} to top_list in {fname}. reason:{err}")
             return False
 
@@ -2318,30 +2877,28 @@ class Client(object):
 
         if isinstance(fname_or_fid, str):
             fname = fname_or_fid
-            fid = await self.get_fid(fname)
+            fid, tbs = await asyncio.gather(self.get_fid(fname), self.get_tbs())
         else:
             fid = fname_or_fid
-            fname = await self.get_fname(fid)
+            fname, tbs = await asyncio.gather(self.get_fname(fid), self.get_tbs())
 
         payload = [
             ('BDUSS', self.BDUSS),
             ('fid', fid),
-            ('tbs', await self.get_tbs()),
+            ('tbs', tbs),
             ('word', fname),
             ('z', tid),
         ]
 
         try:
             res = await self.app.post(
-                yarl.URL.build(path="/c/c/bawu/committop"),
-                data=self.pack_form(payload),
+                _URL_COMMIT_TOP,
+                data=self.pack_form_bytes(payload, 4),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            await self._check_status(res)
 
-        except Exception as err:
+        except _STATUS_ERRORS as err:
             LOG.warning(f"Failed to remove {tid} from top_list in {fname}. reason:{err}")
             return False
 
@@ -2372,7 +2929,7 @@ class Client(object):
 
         try:
             res = await self.web.get(
-                yarl.URL.build(scheme="https", host="tieba.baidu.com", path="/mo/q/bawurecover"),
+                _URL_BAWU_RECOVER,
                 params={
                     'fn': fname,
                     'fid': fid,
@@ -2382,18 +2939,16 @@ class Client(object):
                 },
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['no']):
-                raise ValueError(res_json['error'])
+            res_json: dict = await self._checked_json(res, 'no', 'error')
 
             data = res_json['data']
-            soup = BeautifulSoup(data['content'], 'lxml')
-            items = soup.find_all('a', class_='recover_list_item_btn')
+            content = data['content']
+            items = _XPATH_RECOVER_ITEM(etree.HTML(content)) if content else []
 
             def _parse_item(item):
-                tid = int(item['attr-tid'])
-                pid = int(item['attr-pid'])
-                is_frs_mask = bool(int(item['attr-isfrsmask']))
+                tid = int(item.get('attr-tid'))
+                pid = int(item.get('attr-pid'))
+                is_frs_mask = bool(int(item.get('attr-isfrsmask')))
 
                 return tid, pid, is_frs_mask
 
@@ -2423,22 +2978,21 @@ class Client(object):
 
         try:
             res = await self.web.get(
-                yarl.URL.build(scheme="http", host="tieba.baidu.com", path="/bawu2/platform/listBlackUser"),
+                _URL_LIST_BLACK_USER,
                 params={
                     'word': fname,
                     'pn': pn,
                 },
             )
 
-            soup = BeautifulSoup(await res.text(), 'lxml')
-            items = soup.find_all('td', class_='left_cell')
+            items = _XPATH_BLACK_ITEM(etree.HTML(await res.text()))
 
             def _parse_item(item):
-                user_info_item = item.previous_sibling.input
+                user_info_item = item.getprevious().find('.//input')
                 user = BasicUserInfo()
-                user.user_name = user_info_item['data-user-name']
-                user.user_id = int(user_info_item['data-user-id'])
-                user.portrait = item.a.img['src'][43:]
+                user.user_name = user_info_item.get('data-user-name')
+                user.user_id = int(user_info_item.get('data-user-id'))
+                user.portrait = item.find('.//a').find('.//img').get('src')[43:]
                 return user
 
             res_list = [_parse_item(item) for item in items]
@@ -2463,10 +3017,13 @@ class Client(object):
             bool: 操作是否成功
         """
 
-        fname = fname_or_fid if isinstance(fname_or_fid, str) else await self.get_fname(fname_or_fid)
+        if isinstance(fname_or_fid, str):
+            fname, tbs = fname_or_fid, await self.get_tbs()
+        else:
+            fname, tbs = await asyncio.gather(self.get_fname(fname_or_fid), self.get_tbs())
 
         payload = [
-            ('tbs', await self.get_tbs()),
+            ('tbs', tbs),
             ('user_id', user.user_id),
             ('word', fname),
             ('ie', 'utf-8'),
@@ -2474,15 +3031,13 @@ class Client(object):
 
         try:
             res = await self.web.post(
-                yarl.URL.build(scheme="http", host="tieba.baidu.com", path="/bawu2/platform/addBlack"),
+                _URL_ADD_BLACK,
                 data=payload,
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['errno']):
-                raise ValueError(res_json['errmsg'])
+            await self._check_status(res, 'errno', 'errmsg')
 
-        except Exception as err:
+        except _STATUS_ERRORS as err:
             LOG.warning(f"Failed to add {user.log_name} to black_list in {fname}. reason:{err}")
             return False
 
@@ -2501,26 +3056,27 @@ class Client(object):
             bool: 操作是否成功
         """
 
-        fname = fname_or_fid if isinstance(fname_or_fid, str) else await self.get_fname(fname_or_fid)
+        if isinstance(fname_or_fid, str):
+            fname, tbs = fname_or_fid, await self.get_tbs()
+        else:
+            fname, tbs = await asyncio.gather(self.get_fname(fname_or_fid), self.get_tbs())
 
         payload = [
             ('word', fname),
-            ('tbs', await self.get_tbs()),
+            ('tbs', tbs),
             ('list[]', user.user_id),
             ('ie', 'utf-8'),
         ]
 
         try:
             res = await self.web.post(
-                yarl.URL.build(scheme="http", host="tieba.baidu.com", path="/bawu2/platform/cancelBlack"),
+                _URL_CANCEL_BLACK,
                 data=payload,
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['errno']):
-                raise ValueError(res_json['errmsg'])
+            await self._check_status(res, 'errno', 'errmsg')
 
-        except Exception as err:
+        except _STATUS_ERRORS as err:
             LOG.warning(f"Failed to remove {user.log_name} from black_list in {fname}. reason:{err}")
             return False
 
@@ -2554,13 +3110,11 @@ class Client(object):
 
         try:
             res = await self.web.get(
-                yarl.URL.build(scheme="https", host="tieba.baidu.com", path="/mo/q/bawuappeal"),
+                _URL_BAWU_APPEAL,
                 params=params,
             )
 
-            text = await res.text(encoding='utf-8')
-
-            res_list = [int(item.group(1)) for item in re.finditer('aid=(\\d+)', text)]
+            res_list = [int(aid) for aid in _AID_EXP.findall(await res.read())]
 
         except Exception as err:
             LOG.warning(f"Failed to get appeal_list of {fname}. reason:{err}")
@@ -2601,15 +3155,13 @@ class Client(object):
 
         try:
             res = await self.web.post(
-                yarl.URL.build(scheme="https", host="tieba.baidu.com", path="/mo/q/bawuappealhandle"),
+                _URL_BAWU_APPEAL_HANDLE,
                 data=payload,
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['no']):
-                raise ValueError(res_json['error'])
+            await self._check_status(res, 'no', 'error')
 
-        except Exception as err:
+        except _STATUS_ERRORS as err:
             LOG.warning(f"Failed to handle {appeal_id} in {fname}. reason:{err}")
             return False
 
@@ -2630,12 +3182,16 @@ class Client(object):
         try:
             res = await self.web.get(img_url)
 
-            content = await res.content.read()
             img_type = res.content_type.removeprefix('image/')
             if img_type not in ['jpeg', 'png', 'bmp']:
                 raise ValueError(f"Content-Type should be jpeg, png or bmp rather than {res.content_type}")
 
-            image = cv.imdecode(np.frombuffer(content, np.uint8), cv.IMREAD_COLOR)
+            content = await self._read_buffer(res)
+
+            # 解码大图较慢 放到线程池中执行以免阻塞事件循环
+            image = await asyncio.get_running_loop().run_in_executor(
+                None, cv.imdecode, np.frombuffer(content, np.uint8), cv.IMREAD_COLOR
+            )
             if image is None:
                 raise ValueError("Error in opencv.imdecode")
 
@@ -2678,7 +3234,7 @@ class Client(object):
                 )
             )
 
-            content = await res.content.read()
+            content = await self._read_buffer(res)
 
             image = cv.imdecode(np.frombuffer(content, np.uint8), cv.IMREAD_COLOR)
             if image is None:
@@ -2711,27 +3267,18 @@ class Client(object):
 
         try:
             res = await self.app.post(
-                yarl.URL.build(path="/c/s/msg"),
-                data=self.pack_form(payload),
+                _URL_MSG,
+                data=self.pack_form_bytes(payload, len(payload)),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            res_json: dict = await self._checked_json(res)
 
-            msg = {key: bool(int(value)) for key, value in res_json['message'].items()}
+            message: dict = res_json['message']
+            msg = {key: bool(int(message.get(key, 0))) for key in _NEWMSG_KEYS}
 
         except Exception as err:
             LOG.warning(f"Failed to get new_msg. reason:{err}")
-            msg = {
-                'fans': False,
-                'replyme': False,
-                'atme': False,
-                'agree': False,
-                'pletter': False,
-                'bookmark': False,
-                'count': False,
-            }
+            msg = dict.fromkeys(_NEWMSG_KEYS, False)
 
         return msg
 
@@ -2746,23 +3293,26 @@ class Client(object):
             Replys: 回复列表
         """
 
-        common_proto = CommonReq_pb2.CommonReq()
-        common_proto.BDUSS = self.BDUSS
-        common_proto._client_version = self.latest_version
-        data_proto = ReplyMeReqIdl_pb2.ReplyMeReqIdl.DataReq()
-        data_proto.pn = str(pn)
-        data_proto.common.CopyFrom(common_proto)
-        req_proto = ReplyMeReqIdl_pb2.ReplyMeReqIdl()
-        req_proto.data.CopyFrom(data_proto)
+        # 请求体只取决于BDUSS和pn 按pn缓存打包结果
+        if (req_body := self._replyme_bodies.get(pn)) is None:
+            common_proto = CommonReq_pb2.CommonReq()
+            common_proto.BDUSS = self.BDUSS
+            common_proto._client_version = self.latest_version
+            data_proto = ReplyMeReqIdl_pb2.ReplyMeReqIdl.DataReq()
+            data_proto.pn = str(pn)
+            data_proto.common.CopyFrom(common_proto)
+            req_proto = ReplyMeReqIdl_pb2.ReplyMeReqIdl()
+            req_proto.data.CopyFrom(data_proto)
+            req_body = self._replyme_bodies[pn] = self._pack_proto_bytes(req_proto.SerializeToString())
 
         try:
             res = await self.app_proto.post(
-                yarl.URL.build(path="/c/u/feed/replyme", query_string="cmd=303007"),
-                data=self.pack_proto_bytes(req_proto.SerializeToString()),
+                _URL_REPLY_ME,
+                data=req_body,
             )
 
             res_proto = ReplyMeResIdl_pb2.ReplyMeResIdl()
-            res_proto.ParseFromString(await res.content.read())
+            res_proto.ParseFromString(await self._read_buffer(res))
             if int(res_proto.error.errorno):
                 raise ValueError(res_proto.error.errmsg)
 
@@ -2793,13 +3343,11 @@ class Client(object):
 
         try:
             res = await self.app.post(
-                yarl.URL.build(path="/c/u/feed/atme"),
+                _URL_AT_ME,
                 data=self.pack_form(payload),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', loads=JSON_DECODER.decode, content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            res_json: dict = await self._checked_json(res, empty_as_none=True)
 
             ats = Ats(res_json)
 
@@ -2904,8 +3452,8 @@ class Client(object):
 
         try:
             res = await self.app_proto.post(
-                yarl.URL.build(path="/c/u/feed/userpost", query_string="cmd=303002"),
-                data=self.pack_proto_bytes(req_proto.SerializeToString()),
+                _URL_USER_POST,
+                data=self._pack_proto_bytes(req_proto.SerializeToString()),
             )
 
             res_proto = UserPostResIdl_pb2.UserPostResIdl()
@@ -2949,13 +3497,11 @@ class Client(object):
 
         try:
             res = await self.app.post(
-                yarl.URL.build(path="/c/u/fans/page"),
+                _URL_FANS_PAGE,
                 data=self.pack_form(payload),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', loads=JSON_DECODER.decode, content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            res_json: dict = await self._checked_json(res, empty_as_none=True)
 
             res_list = [
                 UserInfo(_raw_data=ParseDict(user_dict, User_pb2.User(), ignore_unknown_fields=True))
@@ -2989,13 +3535,11 @@ class Client(object):
 
         try:
             res = await self.app.post(
-                yarl.URL.build(path="/c/u/follow/followList"),
+                _URL_FOLLOW_LIST,
                 data=self.pack_form(payload),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', loads=JSON_DECODER.decode, content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            res_json: dict = await self._checked_json(res, empty_as_none=True)
 
             res_list = [
                 UserInfo(_raw_data=ParseDict(user_dict, User_pb2.User(), ignore_unknown_fields=True))
@@ -3023,16 +3567,14 @@ class Client(object):
 
         try:
             res = await self.web.get(
-                yarl.URL.build(scheme="https", host="tieba.baidu.com", path="/mg/o/getForumHome"),
+                _URL_GET_FORUM_HOME,
                 params={
                     'pn': pn,
                     'rn': 200,
                 },
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['errno']):
-                raise ValueError(res_json['errmsg'])
+            res_json: dict = await self._checked_json(res, 'errno', 'errmsg')
 
             forums: list[dict] = res_json['data']['like_forum']['list']
             res_list = [(forum['forum_name'], int(forum['forum_id'])) for forum in forums]
@@ -3071,8 +3613,8 @@ class Client(object):
 
         try:
             res = await self.app_proto.post(
-                yarl.URL.build(path="/c/u/user/getDislikeList", query_string="cmd=309692"),
-                data=self.pack_proto_bytes(req_proto.SerializeToString()),
+                _URL_GET_DISLIKE_LIST,
+                data=self._pack_proto_bytes(req_proto.SerializeToString()),
             )
 
             res_proto = GetDislikeListResIdl_pb2.GetDislikeListResIdl()
@@ -3117,15 +3659,13 @@ class Client(object):
 
         try:
             res = await self.app.post(
-                yarl.URL.build(path="/c/c/user/removeFans"),
+                _URL_REMOVE_FANS,
                 data=self.pack_form(payload),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', loads=JSON_DECODER.decode, content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            await self._check_status(res)
 
-        except Exception as err:
+        except _STATUS_ERRORS as err:
             LOG.warning(f"Failed to remove fan {user.log_name}. reason:{err}")
             return False
 
@@ -3156,15 +3696,13 @@ class Client(object):
 
         try:
             res = await self.app.post(
-                yarl.URL.build(path="/c/c/user/follow"),
+                _URL_FOLLOW,
                 data=self.pack_form(payload),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', loads=JSON_DECODER.decode, content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            await self._check_status(res)
 
-        except Exception as err:
+        except _STATUS_ERRORS as err:
             LOG.warning(f"Failed to follow user {user.log_name}. reason:{err}")
             return False
 
@@ -3195,15 +3733,13 @@ class Client(object):
 
         try:
             res = await self.app.post(
-                yarl.URL.build(path="/c/c/user/unfollow"),
+                _URL_UNFOLLOW,
                 data=self.pack_form(payload),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', loads=JSON_DECODER.decode, content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            await self._check_status(res)
 
-        except Exception as err:
+        except _STATUS_ERRORS as err:
             LOG.warning(f"Failed to unfollow user {user.log_name}. reason:{err}")
             return False
 
@@ -3231,13 +3767,11 @@ class Client(object):
             ]
 
             res = await self.app.post(
-                yarl.URL.build(path="/c/c/forum/like"),
+                _URL_FORUM_LIKE,
                 data=self.pack_form(payload),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            res_json: dict = await self._checked_json(res)
             if int(res_json['error']['errno']):
                 raise ValueError(res_json['error']['errmsg'])
 
@@ -3269,15 +3803,13 @@ class Client(object):
             ]
 
             res = await self.app.post(
-                yarl.URL.build(path="/c/c/forum/unfavolike"),
+                _URL_FORUM_UNFAVOLIKE,
                 data=self.pack_form(payload),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            await self._check_status(res)
 
-        except Exception as err:
+        except _STATUS_ERRORS as err:
             LOG.warning(f"Failed to unfollow forum {fname_or_fid}. reason:{err}")
             return False
 
@@ -3298,23 +3830,22 @@ class Client(object):
         fid = fname_or_fid if isinstance(fname_or_fid, int) else await self.get_fid(fname_or_fid)
 
         try:
+            dislike = [{"tid": 1, "dislike_ids": 7, "fid": fid, "click_time": self.timestamp_ms}]
             payload = [
                 ('BDUSS', self.BDUSS),
                 ('_client_version', self.latest_version),
-                ('dislike', json.dumps([{"tid": 1, "dislike_ids": 7, "fid": fid, "click_time": self.timestamp_ms}])),
+                ('dislike', orjson.dumps(dislike).decode('utf-8')),
                 ('dislike_from', "homepage"),
             ]
 
             res = await self.app.post(
-                yarl.URL.build(path="/c/c/excellent/submitDislike"),
+                _URL_SUBMIT_DISLIKE,
                 data=self.pack_form(payload),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            await self._check_status(res)
 
-        except Exception as err:
+        except _STATUS_ERRORS as err:
             LOG.warning(f"Failed to dislike {fname_or_fid}. reason:{err}")
             return False
 
@@ -3342,15 +3873,13 @@ class Client(object):
             ]
 
             res = await self.app.post(
-                yarl.URL.build(path="/c/c/excellent/submitCancelDislike"),
+                _URL_SUBMIT_CANCEL_DISLIKE,
                 data=self.pack_form(payload),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            await self._check_status(res)
 
-        except Exception as err:
+        except _STATUS_ERRORS as err:
             LOG.warning(f"Failed to undislike {fname_or_fid}. reason:{err}")
             return False
 
@@ -3383,15 +3912,13 @@ class Client(object):
             ]
 
             res = await self.app.post(
-                yarl.URL.build(path="/c/c/thread/setPrivacy"),
+                _URL_SET_PRIVACY,
                 data=self.pack_form(payload),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            await self._check_status(res)
 
-        except Exception as err:
+        except _STATUS_ERRORS as err:
             LOG.warning(f"Failed to set privacy to {tid}. reason:{err}")
             return False
 
@@ -3420,11 +3947,11 @@ class Client(object):
             ]
 
             res = await self.app.post(
-                yarl.URL.build(path="/c/c/forum/sign"),
+                _URL_FORUM_SIGN,
                 data=self.pack_form(payload),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
+            res_json: dict = await self._json(res)
             error_code = int(res_json['error_code'])
             if error_code:
                 raise ValueError(res_json['error_msg'])
@@ -3505,13 +4032,12 @@ class Client(object):
             ]
 
             res = await self.app.post(
-                yarl.URL.build(path="/c/c/post/add"),
-                data=self.pack_form(payload),
+                _URL_POST_ADD,
+                # content之前的9项在同一Client内保持不变
+                data=self.pack_form_bytes(payload, 9),
             )
 
-            res_json: dict = await res.json(encoding='utf-8', content_type=None)
-            if int(res_json['error_code']):
-                raise ValueError(res_json['error_msg'])
+            res_json: dict = await self._checked_json(res)
             if int(res_json['info']['need_vcode']):
                 raise ValueError("need verify code")
 